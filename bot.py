@@ -1270,6 +1270,14 @@ if __name__ == "__main__":
         # Handle different Python versions and event loop policies
         if sys.platform == 'win32':
             asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+        else:
+            # uvloop speeds up the socket I/O discord.py and asyncpg spend their time in; optional, asyncio is the fallback
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+                print("Using uvloop event loop")
+            except ImportError:
+                pass
 
         # Run the main Discord bot
         asyncio.run(main())
@@ -1,6 +1,7 @@
 # cogs/casino_base.py - Updated for multi-server support
+import asyncio
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
@@ -17,6 +18,22 @@ from utils.config import (
 class CasinoBaseCog(commands.Cog):
     """Base cog for casino functionality - provides shared utilities"""
 
+    # Static /카지노도움 text: (field name, field value) per game, then the trailing info fields
+    HELP_GAMES = (
+        ("🎰 슬롯", "`/슬롯` - 슬롯머신"),
+        ("🃏 블랙잭", "`/블랙잭` - 21 만들기"),
+        ("🔢 하이로우", "`/하이로우` - 7 기준 높낮이"),
+        ("🎲 주사위", "`/주사위` - 합 맞히기"),
+        ("🎡 룰렛", "`/룰렛` - 유럽식 룰렛"),
+        ("🎫 복권", "`/복권` - 번호 맞히기"),
+        ("🪙 동전던지기", "`/동전던지기` - 앞뒤 맞히기"),
+        ("💣 지뢰찾기", "`/지뢰찾기` - 지뢰 피하기"),
+        ("🎱 빙고", "`/빙고` - 빙고 게임"),
+        ("🚀 크래시", "`/크래시` - 배수 예측 게임"),
+    )
+    HELP_OTHER_COMMANDS = "• `/카지노통계` - 개인 게임 통계\n• `/코인` - 현재 코인 확인\n• `/코인주기` - 코인 전송"
+    HELP_NOTICE = "• 도박은 적당히!\n• 모든 게임에는 쿨다운이 있습니다 (5초)\n• 각 게임은 설정된 전용 채널에서만 가능\n• 모든 거래는 로그에 기록됩니다"
+
     def __init__(self, bot):
         self.bot = bot
         # FIX: The logger is now a global singleton, so we just get it by name.
@@ -25,6 +42,18 @@ class CasinoBaseCog(commands.Cog):
         # Spam protection per game type
         self.game_cooldowns: Dict[int, Dict[str, datetime]] = {}  # user_id: {game_type: last_time}
         self.cooldown_seconds = 5
+        self.sweep_cooldowns.start()
+
+        # Event loop lag, sampled in the background; games skip their animations while the bot is overloaded
+        self.loop_lag = 0.0
+        self.animation_lag_threshold = 0.25  # seconds
+        self.monitor_loop_lag.start()
+
+        # Background rounds by (game cog name, user_id); holding the task here also keeps it from being garbage collected
+        self.active_rounds: Dict[Tuple[str, int], asyncio.Task] = {}
+
+        # The casino guide is the same for every server apart from its footer
+        self._help_template = self._build_help_template()
 
         # Mapping of game_type to specific channel key
         self.CHANNEL_MAP = {
@@ -41,6 +70,34 @@ class CasinoBaseCog(commands.Cog):
         }
         self.logger.info("카지노 베이스 시스템이 초기화되었습니다.")
 
+    def cog_unload(self):
+        self.sweep_cooldowns.cancel()
+        self.monitor_loop_lag.cancel()
+
+    @tasks.loop(seconds=2)
+    async def monitor_loop_lag(self):
+        """Measure how late a short sleep wakes up; that delay is time other coroutines spent hogging the loop"""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.sleep(0.1)
+        self.loop_lag = max(0.0, loop.time() - start - 0.1)
+
+    def should_skip_animation(self) -> bool:
+        """True while the event loop is lagging, so games should go straight to the result"""
+        return self.loop_lag > self.animation_lag_threshold
+
+    @tasks.loop(minutes=10)
+    async def sweep_cooldowns(self):
+        """Drop expired cooldown entries so game_cooldowns does not grow with every user who ever played"""
+        now = datetime.now()
+        for user_id in list(self.game_cooldowns):
+            user_cooldowns = self.game_cooldowns[user_id]
+            for game_type in [g for g, last in user_cooldowns.items()
+                              if (now - last).total_seconds() >= self.cooldown_seconds]:
+                del user_cooldowns[game_type]
+            if not user_cooldowns:
+                del self.game_cooldowns[user_id]
+
     def check_game_cooldown(self, user_id: int, game_type: str) -> bool:
         """Check if user is on cooldown for specific game"""
         now = datetime.now()
@@ -80,9 +137,12 @@ class CasinoBaseCog(commands.Cog):
         return self.bot.get_cog('CoinsCog')
 
     async def validate_game_start(self, interaction: discord.Interaction, game_type: str, bet: int,
-                                  min_bet: int = 1, max_bet: int = 10000) -> tuple[bool, str]:
+                                  min_bet: int = 1, max_bet: int = 10000,
+                                  check_balance: bool = True) -> tuple[bool, str]:
         """
         Validate if a game can be started for this specific server
+        Pass check_balance=False when the caller charges the bet with CoinsCog.debit_coins right away;
+        that debit already refuses an unaffordable bet, so the balance query here would be redundant
         Returns (can_start: bool, error_message: str)
         """
         guild_id = interaction.guild.id if interaction.guild else None
@@ -120,6 +180,9 @@ class CasinoBaseCog(commands.Cog):
         if not coins_cog:
             return False, "❌ 코인 시스템을 찾을 수 없습니다!"
 
+        if not check_balance:
+            return True, ""
+
         # Check user balance
         user_coins = await coins_cog.get_user_coins(interaction.user.id, interaction.guild.id)
         if user_coins < bet:
@@ -127,6 +190,82 @@ class CasinoBaseCog(commands.Cog):
 
         return True, ""
 
+    def start_round(self, cog: commands.Cog, user_id: int, coro) -> bool:
+        """Run coro in the background as the user's one round of cog's game; False if they already have one running"""
+        key = (cog.qualified_name, user_id)
+        if key in self.active_rounds:
+            # Never scheduled, so close it rather than leave a "never awaited" warning behind
+            coro.close()
+            return False
+
+        task = asyncio.create_task(coro)
+        self.active_rounds[key] = task
+        task.add_done_callback(lambda t: self._finish_round(cog, key, t))
+        return True
+
+    def _finish_round(self, cog: commands.Cog, key: Tuple[str, int], task: asyncio.Task):
+        """Free the user for another round and log anything the round raised to the game's own logger"""
+        if self.active_rounds.get(key) is task:
+            del self.active_rounds[key]
+        if not task.cancelled() and task.exception():
+            cog.logger.error(f"게임 진행 중 오류 발생: {task.exception()}", exc_info=task.exception())
+
+    async def send_deferred_error(self, interaction: discord.Interaction, message: str):
+        """Report an error after defer(); drop the public thinking message so the error stays private"""
+        try:
+            await interaction.delete_original_response()
+        except discord.HTTPException:
+            pass
+        await interaction.followup.send(message, ephemeral=True)
+
+    async def play_frames(self, interaction: discord.Interaction, frames, delay: float) -> bool:
+        """Show each embed from frames on the game message, delay seconds apart; True if the message was lost"""
+        # Edits are fired without waiting on the HTTP round-trip, so the frame pacing is just the sleep.
+        # frames may be a generator that mutates one embed: the next frame is only pulled after the sleep,
+        # by which time the previous edit has already serialized it.
+        frame_edits = []
+        for embed in frames:
+            if frame_edits and frame_edits[-1].done() and isinstance(frame_edits[-1].exception(), discord.NotFound):
+                # The message or interaction is gone; stop animating instead of failing every frame
+                break
+            frame_edits.append(asyncio.create_task(interaction.edit_original_response(embed=embed)))
+            await asyncio.sleep(delay)
+
+        # Make sure no stale frame can land on top of the result
+        frame_results = await asyncio.gather(*frame_edits, return_exceptions=True)
+        return any(isinstance(r, discord.NotFound) for r in frame_results)
+
+    async def show_result(self, interaction: discord.Interaction, embed: discord.Embed, message_lost: bool):
+        """Put the result on the game message, or post it fresh when play_frames reported the message lost"""
+        if message_lost:
+            await interaction.followup.send(embed=embed)
+        else:
+            await interaction.edit_original_response(embed=embed)
+
+    async def debit_failed_message(self, user_id: int, guild_id: int, bet: int) -> str:
+        """Explain why debit_coins refused a bet; only runs on that failure path"""
+        coins_cog = await self.get_coins_cog()
+        user_coins = await coins_cog.get_user_coins(user_id, guild_id) if coins_cog else None
+        if user_coins is not None and user_coins < bet:
+            return f"❌ 코인이 부족합니다! 필요: {bet:,}, 보유: {user_coins:,}"
+        return "베팅 처리 실패!"
+
+    def _build_help_template(self) -> discord.Embed:
+        """Build the server-independent part of the /카지노도움 embed"""
+        embed = discord.Embed(
+            title="🎰 카지노 게임 가이드",
+            description="사용 가능한 모든 카지노 게임과 규칙을 안내합니다.",
+            color=discord.Color.blue()
+        )
+
+        for name, value in self.HELP_GAMES:
+            embed.add_field(name=name, value=value, inline=True)
+
+        embed.add_field(name="📊 기타 명령어", value=self.HELP_OTHER_COMMANDS, inline=False)
+        embed.add_field(name="⚠️ 주의사항", value=self.HELP_NOTICE, inline=False)
+
+        return embed
+
     @app_commands.command(name="카지노통계", description="개인 카지노 게임 통계를 확인합니다.")
     async def casino_stats(self, interaction: discord.Interaction, user: discord.Member = None):
         # Check if casino games are enabled
@@ -242,40 +381,8 @@ class CasinoBaseCog(commands.Cog):
             await interaction.response.send_message("❌ 이 서버에서는 카지노 게임이 비활성화되어 있습니다!", ephemeral=True)
             return
 
-        embed = discord.Embed(
-            title="🎰 카지노 게임 가이드",
-            description="사용 가능한 모든 카지노 게임과 규칙을 안내합니다.",
-            color=discord.Color.blue()
-        )
-
-        games_list = [
-            ("🎰 슬롯", "`/슬롯` - 슬롯머신"),
-            ("🃏 블랙잭", "`/블랙잭` - 21 만들기"),
-            ("🔢 하이로우", "`/하이로우` - 7 기준 높낮이"),
-            ("🎲 주사위", "`/주사위` - 합 맞히기"),
-            ("🎡 룰렛", "`/룰렛` - 유럽식 룰렛"),
-            ("🎫 복권", "`/복권` - 번호 맞히기"),
-            ("🪙 동전던지기", "`/동전던지기` - 앞뒤 맞히기"),
-            ("💣 지뢰찾기", "`/지뢰찾기` - 지뢰 피하기"),
-            ("🎱 빙고", "`/빙고` - 빙고 게임"),
-            ("🚀 크래시", "`/크래시` - 배수 예측 게임"),
-        ]
-
-        for name, value in games_list:
-            embed.add_field(name=name, value=value, inline=True)
-
-        embed.add_field(
-            name="📊 기타 명령어",
-            value="• `/카지노통계` - 개인 게임 통계\n• `/코인` - 현재 코인 확인\n• `/코인주기` - 코인 전송",
-            inline=False
-        )
-
-        embed.add_field(
-            name="⚠️ 주의사항",
-            value="• 도박은 적당히!\n• 모든 게임에는 쿨다운이 있습니다 (5초)\n• 각 게임은 설정된 전용 채널에서만 가능\n• 모든 거래는 로그에 기록됩니다",
-            inline=False
-        )
-
+        # Everything but the footer is static, so start from a copy of the prebuilt guide
+        embed = self._help_template.copy()
         embed.set_footer(text=f"Server: {interaction.guild.name} | 책임감 있는 게임 플레이를 권장합니다")
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
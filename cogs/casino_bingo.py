@@ -12,6 +12,9 @@ from utils.config import (
     is_server_configured
 )
 
+# Cards and called numbers decide who wins the pot, so they come from the OS CSPRNG
+_OUTCOME_RNG = random.SystemRandom()
+
 
 class BingoCard:
     """Represents a bingo card"""
@@ -27,16 +30,16 @@ class BingoCard:
         card = []
 
         # B column: 1-15
-        b_column = random.sample(range(1, 16), 5)
+        b_column = _OUTCOME_RNG.sample(range(1, 16), 5)
         # I column: 16-30
-        i_column = random.sample(range(16, 31), 5)
+        i_column = _OUTCOME_RNG.sample(range(16, 31), 5)
         # N column: 31-45 (with center free space)
-        n_column = random.sample(range(31, 46), 4)
+        n_column = _OUTCOME_RNG.sample(range(31, 46), 4)
         n_column.insert(2, 'FREE')  # Insert FREE in the middle
         # G column: 46-60
-        g_column = random.sample(range(46, 61), 5)
+        g_column = _OUTCOME_RNG.sample(range(46, 61), 5)
         # O column: 61-75
-        o_column = random.sample(range(61, 76), 5)
+        o_column = _OUTCOME_RNG.sample(range(61, 76), 5)
 
         # Combine columns into rows
         for i in range(5):
@@ -185,7 +188,7 @@ class MultiBingoView(discord.ui.View):
             return
 
         # Call a random number
-        called_number = random.choice(available_numbers)
+        called_number = _OUTCOME_RNG.choice(available_numbers)
         self.called_numbers.append(called_number)
         self.numbers_called += 1
 
@@ -11,6 +11,13 @@ from utils.config import (
     get_server_setting
 )
 
+# Ranks worth 10, and the dealer up-cards that make doubling on 10 a bad idea
+_FACE_RANKS = frozenset({'J', 'Q', 'K'})
+_STRONG_DEALER_RANKS = frozenset({'10', 'J', 'Q', 'K', 'A'})
+
+# Deck shuffles decide every hand, so they use the OS CSPRNG like the other games' outcomes
+_OUTCOME_RNG = random.SystemRandom()
+
 
 class BlackjackView(discord.ui.View):
     """Enhanced Blackjack with double down, insurance, and split"""
@@ -29,7 +36,7 @@ class BlackjackView(discord.ui.View):
 
         # Create and shuffle deck
         self.deck = self.create_deck()
-        random.shuffle(self.deck)
+        _OUTCOME_RNG.shuffle(self.deck)
 
         # Deal initial hands
         self.player_hand = [self.draw_card(), self.draw_card()]
@@ -56,7 +63,7 @@ class BlackjackView(discord.ui.View):
         for _ in range(4):
             for suit in suits:
                 for rank in ranks:
-                    value = 11 if rank == 'A' else (10 if rank in ['J', 'Q', 'K'] else int(rank))
+                    value = 11 if rank == 'A' else (10 if rank in _FACE_RANKS else int(rank))
                     deck.append({'rank': rank, 'suit': suit, 'value': value})
 
         return deck
@@ -65,7 +72,7 @@ class BlackjackView(discord.ui.View):
         """Draw a card from deck"""
         if len(self.deck) < 10:  # Reshuffle if running low
             self.deck = self.create_deck()
-            random.shuffle(self.deck)
+            _OUTCOME_RNG.shuffle(self.deck)
         return self.deck.pop()
 
     def calculate_hand_value(self, hand: List[Dict]) -> int:
@@ -589,7 +596,7 @@ class BlackjackCog(commands.Cog):
             if view.can_double_down():
                 if player_val == 11:
                     hints.append("💡 11에서 더블다운 추천")
-                elif player_val == 10 and dealer_up not in ['10', 'J', 'Q', 'K', 'A']:
+                elif player_val == 10 and dealer_up not in _STRONG_DEALER_RANKS:
                     hints.append("💡 더블다운 고려해보세요")
 
             if view.can_split():
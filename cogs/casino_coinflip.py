@@ -11,6 +11,13 @@ from utils.config import (
     get_server_setting
 )
 
+# Flip animation: same ~2s on screen as before, in half the message edits
+_FLIP_FRAMES = 2
+_FLIP_FRAME_DELAY = 1.0
+
+# Heads or tails is drawn from the OS CSPRNG, like the other games' results
+_OUTCOME_RNG = random.SystemRandom()
+
 
 class CoinflipCog(commands.Cog):
     """Coinflip casino game - Multi-server aware"""
@@ -32,7 +39,7 @@ class CoinflipCog(commands.Cog):
         max_bet = get_server_setting(interaction.guild.id, 'coinflip_max_bet', 1000)
 
         return await casino_base.validate_game_start(
-            interaction, "coinflip", bet, min_bet, max_bet
+            interaction, "coinflip", bet, min_bet, max_bet, check_balance=False
         )
 
     @app_commands.command(name="동전던지기", description="동전 던지기 게임")
@@ -57,15 +64,19 @@ class CoinflipCog(commands.Cog):
             return
 
         coins_cog = self.bot.get_cog('CoinsCog')
-        if not await coins_cog.remove_coins(interaction.user.id, interaction.guild.id, bet, "coinflip_bet", "Coinflip bet"):
-            await interaction.response.send_message("베팅 처리 실패!", ephemeral=True)
+        balance = await coins_cog.debit_coins(interaction.user.id, interaction.guild.id, bet, "coinflip_bet", "Coinflip bet")
+        if balance is None:
+            casino_base = self.bot.get_cog('CasinoBaseCog')
+            await interaction.response.send_message(
+                await casino_base.debit_failed_message(interaction.user.id, interaction.guild.id, bet), ephemeral=True
+            )
             return
 
         await interaction.response.defer()
 
         # Flip animation
         flip_emojis = ["🪙", "⚪", "🟡", "⚫"]
-        for i in range(4):
+        for i in range(_FLIP_FRAMES):
             embed = discord.Embed(
                 title="🪙 동전 던지는 중...",
                 description=f"{flip_emojis[i % len(flip_emojis)]} 빙글빙글...",
@@ -73,17 +84,17 @@ class CoinflipCog(commands.Cog):
             )
             embed.set_footer(text=f"Server: {interaction.guild.name}")
             await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(_FLIP_FRAME_DELAY)
 
         # Final result
-        result = random.choice(["heads", "tails"])
+        result = _OUTCOME_RNG.choice(["heads", "tails"])
         won = result == choice
 
         if won:
             # Get server-specific payout multiplier
             payout_multiplier = get_server_setting(interaction.guild.id, 'coinflip_payout', 2.0)
             payout = int(bet * payout_multiplier)
-            await coins_cog.add_coins(interaction.user.id, interaction.guild.id, payout, "coinflip_win", f"Coinflip win: {result}")
+            balance = await coins_cog.credit_and_get_balance(interaction.user.id, interaction.guild.id, payout, "coinflip_win", f"Coinflip win: {result}")
 
         choice_korean = {"heads": "앞면", "tails": "뒷면"}
         result_korean = choice_korean[result]
@@ -102,8 +113,8 @@ class CoinflipCog(commands.Cog):
                 color=discord.Color.red()
             )
 
-        new_balance = await coins_cog.get_user_coins(interaction.user.id, interaction.guild.id)
-        embed.add_field(name="현재 잔액", value=f"{new_balance:,} 코인", inline=False)
+        # The bet/payout write already returned the balance
+        embed.add_field(name="현재 잔액", value=f"{balance:,} 코인", inline=False)
         embed.set_footer(text=f"Server: {interaction.guild.name}")
 
         await interaction.edit_original_response(embed=embed)
@@ -7,9 +7,12 @@ import random
 import math
 import os
 import io
+import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib import font_manager
+from dataclasses import dataclass
+from itertools import islice
 from typing import Dict
 
 from utils.logger import get_logger
@@ -36,45 +39,90 @@ else:
     # Fallback to default font if Korean font not available
     font_prop = None
 
+# The crash point decides every bet in a round, so it is drawn from the OS CSPRNG
+_OUTCOME_RNG = random.SystemRandom()
+
+
+def compute_trajectory(crash_point: float, start: float = 1.0) -> tuple:
+    """Precompute every multiplier a game shows, one per tick, until it reaches the crash point"""
+    trajectory = []
+    multiplier = start
+    while multiplier < crash_point:
+        # Increase multiplier based on current value
+        multiplier = round(multiplier + 0.01 + multiplier / 20, 2)
+        trajectory.append(multiplier)
+    return tuple(trajectory)
+
+
+@dataclass(slots=True)
+class CrashPlayer:
+    """Per-player state within a crash game"""
+    bet: int
+    cashed_out: bool = False
+    cash_out_multiplier: float = 0.0
+
 
 class CrashGame:
     """Shared crash game instance for multiple players"""
 
+    __slots__ = (
+        "bot", "guild_id", "crash_point", "trajectory", "players", "active_count",
+        "current_multiplier", "game_started", "game_over", "start_time", "history", "history_len",
+    )
+
     def __init__(self, bot, crash_point: float, guild_id: int):
         self.bot = bot
         self.guild_id = guild_id
         self.crash_point = crash_point
-        self.players: Dict[int, dict] = {}  # user_id: {bet: int, cashed_out: bool, cash_out_multiplier: float}
+        self.trajectory = compute_trajectory(crash_point)
+        self.players: Dict[int, CrashPlayer] = {}  # user_id: player state
+        self.active_count = 0  # Players who haven't cashed out, kept in sync by add/remove/cash_out
         self.current_multiplier = 1.0
         self.game_started = False
         self.game_over = False
         self.start_time = None
-        self.history: list[float] = [1.0]  # Track multiplier history for chart
+        # Track multiplier history for chart in a preallocated buffer; only the first history_len entries are valid
+        self.history = np.empty(2048, dtype=np.float64)
+        self.history[0] = 1.0
+        self.history_len = 1
 
     def add_player(self, user_id: int, bet: int):
         """Add a player to the game"""
-        self.players[user_id] = {
-            'bet': bet,
-            'cashed_out': False,
-            'cash_out_multiplier': 0.0
-        }
+        if user_id not in self.players:
+            self.active_count += 1
+        self.players[user_id] = CrashPlayer(bet)
 
     def cash_out_player(self, user_id: int) -> bool:
         """Cash out a player"""
-        if user_id in self.players and not self.players[user_id]['cashed_out'] and not self.game_over:
-            self.players[user_id]['cashed_out'] = True
-            self.players[user_id]['cash_out_multiplier'] = self.current_multiplier
+        if user_id in self.players and not self.players[user_id].cashed_out and not self.game_over:
+            self.players[user_id].cashed_out = True
+            self.players[user_id].cash_out_multiplier = self.current_multiplier
+            self.active_count -= 1
             return True
         return False
 
+    def remove_player(self, user_id: int) -> CrashPlayer:
+        """Remove a player from the game and return their data"""
+        player_data = self.players.pop(user_id)
+        if not player_data.cashed_out:
+            self.active_count -= 1
+        return player_data
+
     def get_active_players_count(self) -> int:
         """Get count of players who haven't cashed out"""
-        return sum(1 for p in self.players.values() if not p['cashed_out'])
+        return self.active_count
 
     def update_multiplier(self, new_multiplier: float):
         """Update multiplier and add to history"""
         self.current_multiplier = new_multiplier
-        self.history.append(new_multiplier)
+        if self.history_len == len(self.history):
+            self.history = np.resize(self.history, self.history_len * 2)
+        self.history[self.history_len] = new_multiplier
+        self.history_len += 1
+
+    def get_history(self) -> np.ndarray:
+        """Get a view of the recorded multiplier history"""
+        return self.history[:self.history_len]
 
 
 class JoinBetModal(discord.ui.Modal, title="크래시 게임 참가"):
@@ -132,6 +180,7 @@ class CrashView(discord.ui.View):
         self.cog = cog
         self.bot = cog.bot
         self.game = game
+        self.running_embed = None  # Reused across ticks, rebuilt only when the player list changes
         self.update_button_states()
 
     def update_button_states(self):
@@ -155,13 +204,13 @@ class CrashView(discord.ui.View):
             self.start_button.disabled = True
             self.cash_out_button.disabled = True
 
-    def draw_chart(self) -> io.BytesIO:
-        """Create a chart showing the multiplier progression"""
-        plt.figure(figsize=(10, 6))
+    def draw_chart(self, final: bool = False) -> io.BytesIO:
+        """Create a chart showing the multiplier progression (PNG for the final frame, JPEG otherwise)"""
+        plt.figure(figsize=(8, 4))
 
         # Plot the multiplier history
-        time_points = list(range(len(self.game.history)))
-        plt.plot(time_points, self.game.history, 'b-', linewidth=2, label='배수')
+        history = self.game.get_history()
+        plt.plot(np.arange(len(history)), history, 'b-', linewidth=2, label='배수')
 
         # Add crash point line if game is over
         if self.game.game_over:
@@ -170,16 +219,11 @@ class CrashView(discord.ui.View):
 
         # Mark cashout points
         for user_id, player_data in self.game.players.items():
-            if player_data['cashed_out']:
-                # Find the time point corresponding to the cashout multiplier
-                cashout_time_point = 0
-                for i, hist_multiplier in enumerate(self.game.history):
-                    if hist_multiplier <= player_data['cash_out_multiplier']:
-                        cashout_time_point = i
-                    else:
-                        break # Once multiplier is exceeded, stop.
+            if player_data.cashed_out:
+                # History only ever increases, so the last point not above the cashout multiplier is found by bisection
+                cashout_time_point = max(0, int(np.searchsorted(history, player_data.cash_out_multiplier, side='right')) - 1)
 
-                plt.scatter(cashout_time_point, player_data['cash_out_multiplier'],
+                plt.scatter(cashout_time_point, player_data.cash_out_multiplier,
                             color='green', s=100, zorder=5, alpha=0.8)
 
         plt.xlabel('시간 (초)', fontproperties=font_prop if font_prop else None)
@@ -194,21 +238,40 @@ class CrashView(discord.ui.View):
         plt.ylim(1.0, max_y)
 
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+        if final:
+            plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+        else:
+            # Intermediate frames are replaced within a second, so a small, fast lossy encode is good enough
+            plt.savefig(buf, format='jpeg', dpi=72, bbox_inches='tight', pil_kwargs={'quality': 70})
         plt.close()
         buf.seek(0)
         return buf
 
-    async def create_chart(self) -> discord.File:
+    async def create_chart(self, final: bool = False) -> discord.File:
         """Create chart file for Discord"""
         try:
-            buf = self.draw_chart()
-            return discord.File(buf, filename="crash_chart.png")
+            buf = self.draw_chart(final)
+            return discord.File(buf, filename="crash_chart.png" if final else "crash_chart.jpg")
         except Exception as e:
             # FIX: Log chart creation error with guild_id
             self.cog.logger.error(f"차트 생성 실패 for guild {self.game.guild_id}: {e}")
             return None
 
+    def get_status_text(self) -> str:
+        """Get the live multiplier/active player summary"""
+        return f"현재 배수: **{self.game.current_multiplier:.2f}x**\n활성 플레이어: {self.game.get_active_players_count()}명"
+
+    async def create_running_embed(self) -> discord.Embed:
+        """Get the in-progress embed, only updating the title and status field after the first build"""
+        if self.running_embed is None:
+            self.running_embed = await self.create_embed()
+            return self.running_embed
+
+        self.running_embed.title = f"🚀 크래시 진행 중... {self.game.current_multiplier:.2f}x"
+        # The status field is always first while the game is running
+        self.running_embed.set_field_at(0, name="📊 현재 상태", value=self.get_status_text(), inline=False)
+        return self.running_embed
+
     async def create_embed(self, final: bool = False) -> discord.Embed:
         """Create game state embed"""
         if self.game.game_over and final:
@@ -224,30 +287,26 @@ class CrashView(discord.ui.View):
         embed = discord.Embed(title=title, color=color)
 
         if self.game.game_started:
-            embed.add_field(
-                name="📊 현재 상태",
-                value=f"현재 배수: **{self.game.current_multiplier:.2f}x**\n활성 플레이어: {self.game.get_active_players_count()}명",
-                inline=False
-            )
+            embed.add_field(name="📊 현재 상태", value=self.get_status_text(), inline=False)
 
         if self.game.players:
             player_info = []
             # Display up to 10 players in the embed
-            for user_id, player_data in list(self.game.players.items())[:10]:
+            for user_id, player_data in islice(self.game.players.items(), 10):
                 try:
                     # Fetch user to get display name, fallback to ID
                     user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
                     username = user.display_name if user else f"User {user_id}"
 
-                    if player_data['cashed_out']:
-                        status = f"✅ {player_data['cash_out_multiplier']:.2f}x"
-                        payout = int(player_data['bet'] * player_data['cash_out_multiplier'])
+                    if player_data.cashed_out:
+                        status = f"✅ {player_data.cash_out_multiplier:.2f}x"
+                        payout = int(player_data.bet * player_data.cash_out_multiplier)
                         player_info.append(f"{username}: {status} (+{payout:,})")
                     elif self.game.game_over:
                         status = "💥 추락"
-                        player_info.append(f"{username}: {status} (-{player_data['bet']:,})")
+                        player_info.append(f"{username}: {status} (-{player_data.bet:,})")
                     else:
-                        player_info.append(f"{username}: 🎲 대기중 ({player_data['bet']:,})")
+                        player_info.append(f"{username}: 🎲 대기중 ({player_data.bet:,})")
                 except Exception: # Catch potential errors during user fetching or processing
                     continue
 
@@ -293,8 +352,8 @@ class CrashView(discord.ui.View):
             await interaction.response.send_message("⚠ 이 게임에 참가하지 않았습니다!", ephemeral=True)
             return
 
-        bet_amount = player_data['bet']
-        del self.game.players[interaction.user.id]
+        bet_amount = player_data.bet
+        self.game.remove_player(interaction.user.id)
 
         coins_cog = self.cog.bot.get_cog('CoinsCog')
         if coins_cog:
@@ -328,23 +387,25 @@ class CrashView(discord.ui.View):
         if interaction.user.id not in self.game.players:
             await interaction.response.send_message("⚠ 이 게임에 참가하지 않았습니다!", ephemeral=True)
             return
-        if self.game.players[interaction.user.id]['cashed_out']:
+        if self.game.players[interaction.user.id].cashed_out:
             await interaction.response.send_message("⚠ 이미 캐시아웃했습니다!", ephemeral=True)
             return
 
         await interaction.response.defer()
         if self.game.cash_out_player(interaction.user.id):
+            # Player list changed, so the next tick rebuilds the full embed
+            self.running_embed = None
             player_data = self.game.players[interaction.user.id]
-            payout = int(player_data['bet'] * player_data['cash_out_multiplier'])
+            payout = int(player_data.bet * player_data.cash_out_multiplier)
 
             coins_cog = self.cog.bot.get_cog('CoinsCog')
             if coins_cog:
                 # FIX: Pass guild_id to add_coins for multi-server support
                 await coins_cog.add_coins(interaction.user.id, interaction.guild.id, payout, "crash_win",
-                                          f"Crash cashout at {player_data['cash_out_multiplier']:.2f}x")
+                                          f"Crash cashout at {player_data.cash_out_multiplier:.2f}x")
 
             await interaction.followup.send(
-                f"✅ {interaction.user.mention}님이 **{player_data['cash_out_multiplier']:.2f}x**에서 캐시아웃! {payout:,} 코인 획득!",
+                f"✅ {interaction.user.mention}님이 **{player_data.cash_out_multiplier:.2f}x**에서 캐시아웃! {payout:,} 코인 획득!",
                 ephemeral=False
             )
         else:
@@ -399,16 +460,16 @@ class CrashCog(commands.Cog):
 
     def generate_crash_point(self) -> float:
         """Generate crash point with custom odds distribution"""
-        rand = random.random()
+        rand = _OUTCOME_RNG.random()
 
         if rand <= 0.50:  # 50% chance for 1.1x - 2.0x (safe cashouts)
-            return round(random.uniform(1.1, 2.0), 2)
+            return round(_OUTCOME_RNG.uniform(1.1, 2.0), 2)
         elif rand <= 0.85:  # 35% chance for 2.0x - 4.0x (moderate risk)
-            return round(random.uniform(2.0, 4.0), 2)
+            return round(_OUTCOME_RNG.uniform(2.0, 4.0), 2)
         elif rand <= 0.95:  # 10% chance for 4.0x - 10.0x (good multipliers)
-            return round(random.uniform(4.0, 10.0), 2)
+            return round(_OUTCOME_RNG.uniform(4.0, 10.0), 2)
         elif rand <= 0.99:  # 4% chance for 10.0x - 50.0x (high risk/reward)
-            return round(random.uniform(10.0, 50.0), 2)
+            return round(_OUTCOME_RNG.uniform(10.0, 50.0), 2)
         else:  # 1% chance for 100.0x (jackpot)
             return 100.0
 
@@ -505,19 +566,15 @@ class CrashCog(commands.Cog):
             self.logger.error(f"run_crash_game: 필수 컴포넌트 누락 for guild {guild_id}", extra={'guild_id': guild_id})
             return
 
-        while (current_game.current_multiplier < current_game.crash_point and
-               current_game.get_active_players_count() > 0):
+        for new_multiplier in current_game.trajectory:
+            if current_game.get_active_players_count() == 0:
+                break
 
             await asyncio.sleep(0.75)
-
-            # Increase multiplier based on current value
-            increment = 0.01 + (current_game.current_multiplier / 20)
-            new_multiplier = current_game.current_multiplier + increment
-            new_multiplier = round(new_multiplier, 2)
             current_game.update_multiplier(new_multiplier)
 
             try:
-                embed = await game_view.create_embed()
+                embed = await game_view.create_running_embed()
                 chart_file = await game_view.create_chart()
                 await game_message.edit(embed=embed, view=game_view, attachments=[chart_file] if chart_file else [])
             except (discord.NotFound, discord.HTTPException) as e:
@@ -544,7 +601,7 @@ class CrashCog(commands.Cog):
             try:
                 game_view.update_button_states()
                 embed = await game_view.create_embed(final=True)
-                chart_file = await game_view.create_chart()
+                chart_file = await game_view.create_chart(final=True)
                 await game_message.edit(embed=embed, view=game_view, attachments=[chart_file] if chart_file else [])
             except (discord.NotFound, discord.HTTPException) as e:
                 # FIX: Log error with guild_id
@@ -4,6 +4,7 @@ from discord.ext import commands
 from discord import app_commands
 import asyncio
 import random
+from functools import lru_cache
 
 from utils.logger import get_logger
 from utils.config import (
@@ -11,6 +12,40 @@ from utils.config import (
     get_server_setting
 )
 
+# Visual for each die face, indexed by value (index 0 unused)
+_DICE_VISUALS = tuple(f"🎲[{i}]" for i in range(7))
+
+# Rolling animation length; every frame is a Discord REST edit, so keep it short
+_ROLL_FRAMES = 2
+_ROLL_FRAME_DELAY = 1.0
+
+# Base payout multiplier indexed by the guessed total (higher multiplier for harder guesses)
+_DICE_BASE_MULT = (0, 0, 35, 17, 11, 8, 6, 5, 6, 8, 11, 17, 35)
+
+# The roll that settles the bet uses the OS CSPRNG; the rolling frames are decoration and use `random`
+_OUTCOME_RNG = random.SystemRandom()
+
+
+@lru_cache(maxsize=None)
+def _scaled_multipliers(modifier: float) -> tuple:
+    """Apply a server's dice_multiplier_modifier to the base payout table"""
+    return tuple(max(1, int(m * modifier)) for m in _DICE_BASE_MULT)
+
+
+@lru_cache(maxsize=None)
+def _odds_text(modifier: float) -> str:
+    """Build the odds table shown under every result, once per distinct modifier"""
+    mult = _scaled_multipliers(modifier)
+    return (
+        "**📊 배당표:**\n"
+        f"2, 12: {mult[2]}배 💎\n"
+        f"3, 11: {mult[3]}배 💰\n"
+        f"4, 10: {mult[4]}배 🏆\n"
+        f"5, 9: {mult[5]}배 ⭐\n"
+        f"6, 8: {mult[6]}배 💚\n"
+        f"7: {mult[7]}배 💙"
+    )
+
 
 class DiceGameCog(commands.Cog):
     """Simple dice guessing game - Multi-server aware"""
@@ -23,15 +58,7 @@ class DiceGameCog(commands.Cog):
 
     def get_dice_visual(self, value):
         """Get visual representation of dice value"""
-        dice_visuals = {
-            1: "🎲[1]",
-            2: "🎲[2]",
-            3: "🎲[3]",
-            4: "🎲[4]",
-            5: "🎲[5]",
-            6: "🎲[6]"
-        }
-        return dice_visuals.get(value, f"🎲[{value}]")
+        return _DICE_VISUALS[value] if 1 <= value <= 6 else f"🎲[{value}]"
 
     def create_dice_display(self, die1, die2, total, rolling=False):
         """Create visual dice display"""
@@ -51,7 +78,7 @@ class DiceGameCog(commands.Cog):
         max_bet = get_server_setting(interaction.guild.id, 'dice_max_bet', 200)
 
         return await casino_base.validate_game_start(
-            interaction, "dice_game", bet, min_bet, max_bet
+            interaction, "dice_game", bet, min_bet, max_bet, check_balance=False
         )
 
     @app_commands.command(name="주사위", description="주사위 합 맞히기 게임")
@@ -69,55 +96,77 @@ class DiceGameCog(commands.Cog):
             await interaction.response.send_message("주사위 합은 2-12 사이만 가능합니다!", ephemeral=True)
             return
 
+        casino_base = self.bot.get_cog('CasinoBaseCog')
+        if not casino_base:
+            await interaction.response.send_message("카지노 시스템을 찾을 수 없습니다!", ephemeral=True)
+            return
+
+        # One roll per user at a time, so spamming the command cannot stack up animations
+        if not casino_base.start_round(self, interaction.user.id, self.run_round(interaction, casino_base, bet, guess)):
+            await interaction.response.send_message("⏳ 이미 진행 중인 주사위 게임이 있습니다!", ephemeral=True)
+
+    async def run_round(self, interaction: discord.Interaction, casino_base, bet: int, guess: int):
+        """Take the bet and play the game in the background, so the command handler returns right away"""
         can_start, error_msg = await self.validate_game(interaction, bet)
         if not can_start:
             await interaction.response.send_message(error_msg, ephemeral=True)
             return
 
         coins_cog = self.bot.get_cog('CoinsCog')
-        if not await coins_cog.remove_coins(interaction.user.id, interaction.guild.id, bet, "dice_game_bet", "Dice game bet"):
-            await interaction.response.send_message("베팅 처리 실패!", ephemeral=True)
+        balance = await coins_cog.debit_coins(interaction.user.id, interaction.guild.id, bet, "dice_game_bet", "Dice game bet")
+        if balance is None:
+            await interaction.response.send_message(
+                await casino_base.debit_failed_message(interaction.user.id, interaction.guild.id, bet), ephemeral=True
+            )
             return
 
         await interaction.response.defer()
-
-        # Show initial bet
-        embed = discord.Embed(
-            title="🎲 주사위 게임",
-            description=f"예상 합계: **{guess}**\n베팅 금액: **{bet:,}** 코인",
-            color=discord.Color.blue()
-        )
-        embed.set_footer(text=f"Server: {interaction.guild.name}")
-        await interaction.edit_original_response(embed=embed)
-        await asyncio.sleep(1)
-
-        # Rolling animation
-        for i in range(6):
-            die1 = random.randint(1, 6)
-            die2 = random.randint(1, 6)
-            embed = discord.Embed(
-                title="🎲 주사위 굴리는 중...",
-                description=f"🌟 굴리는 중... {i + 1}/6\n\n{self.create_dice_display(die1, die2, 0, rolling=True)}",
+        await self.play_round(interaction, casino_base, coins_cog, bet, guess, balance)
+
+    async def play_round(self, interaction: discord.Interaction, casino_base, coins_cog, bet: int, guess: int, balance: int):
+        """Roll the dice with animation, settle the bet and show the result"""
+        # The bet intro and the rolling faces are all skipped while the bot is lagging
+        skip_animation = casino_base.should_skip_animation()
+        # Draw the faces for every animation frame in one call
+        faces = random.choices(range(1, 7), k=0 if skip_animation else _ROLL_FRAMES * 2)
+
+        def roll_frames():
+            if skip_animation:
+                return
+            # Show initial bet
+            yield discord.Embed(
+                title="🎲 주사위 게임",
+                description=f"예상 합계: **{guess}**\n베팅 금액: **{bet:,}** 코인",
                 color=discord.Color.blue()
-            )
+            ).set_footer(text=f"Server: {interaction.guild.name}")
+
+            # Rolling animation - one embed reused for every frame, only the description changes
+            embed = discord.Embed(title="🎲 주사위 굴리는 중...", color=discord.Color.blue())
             embed.set_footer(text=f"Server: {interaction.guild.name}")
-            await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.7)
+            for i in range(_ROLL_FRAMES):
+                die1, die2 = faces[2 * i], faces[2 * i + 1]
+                embed.description = f"🌟 굴리는 중... {i + 1}/{_ROLL_FRAMES}\n\n{self.create_dice_display(die1, die2, 0, rolling=True)}"
+                yield embed
+
+        message_lost = await casino_base.play_frames(interaction, roll_frames(), _ROLL_FRAME_DELAY)
 
         # Final roll
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
+        die1 = _OUTCOME_RNG.randint(1, 6)
+        die2 = _OUTCOME_RNG.randint(1, 6)
         total = die1 + die2
         won = total == guess
 
-        # Payout calculation (higher multiplier for harder guesses) - server configurable
-        base_multipliers = {2: 35, 3: 17, 4: 11, 5: 8, 6: 6, 7: 5, 8: 6, 9: 8, 10: 11, 11: 17, 12: 35}
+        # Payout calculation - server configurable
         multiplier_modifier = get_server_setting(interaction.guild.id, 'dice_multiplier_modifier', 1.0)
-        payout_multipliers = {k: max(1, int(v * multiplier_modifier)) for k, v in base_multipliers.items()}
+        payout_multipliers = _scaled_multipliers(multiplier_modifier)
 
+        credit_task = None
         if won:
             payout = bet * payout_multipliers[guess]
-            await coins_cog.add_coins(interaction.user.id, interaction.guild.id, payout, "dice_game_win", f"Dice win: {total}")
+            # Credit in the background while the result embed is built
+            credit_task = asyncio.create_task(
+                coins_cog.credit_and_get_balance(interaction.user.id, interaction.guild.id, payout, "dice_game_win", f"Dice win: {total}")
+            )
 
         if won:
             embed = discord.Embed(
@@ -139,22 +188,17 @@ class DiceGameCog(commands.Cog):
 
         embed.description = result_desc
 
-        new_balance = await coins_cog.get_user_coins(interaction.user.id, interaction.guild.id)
+        # The debit already returned the post-bet balance; only a win changes it again
+        new_balance = balance
+        if credit_task:
+            new_balance = await credit_task
         embed.add_field(name="💳 현재 잔액", value=f"{new_balance:,} 코인", inline=False)
 
         # Add odds table for reference
-        odds_text = "**📊 배당표:**\n"
-        odds_text += f"2, 12: {payout_multipliers[2]}배 💎\n"
-        odds_text += f"3, 11: {payout_multipliers[3]}배 💰\n"
-        odds_text += f"4, 10: {payout_multipliers[4]}배 🏆\n"
-        odds_text += f"5, 9: {payout_multipliers[5]}배 ⭐\n"
-        odds_text += f"6, 8: {payout_multipliers[6]}배 💚\n"
-        odds_text += f"7: {payout_multipliers[7]}배 💙"
-
-        embed.add_field(name="ℹ️ 참고", value=odds_text, inline=False)
+        embed.add_field(name="ℹ️ 참고", value=_odds_text(multiplier_modifier), inline=False)
         embed.set_footer(text=f"Server: {interaction.guild.name}")
 
-        await interaction.edit_original_response(embed=embed)
+        await casino_base.show_result(interaction, embed, message_lost)
         # FIX: Add extra={'guild_id': ...} for multi-server logging context
         self.logger.info(
             f"{interaction.user}가 주사위에서 {bet} 코인 {'승리' if won else '패배'}",
@@ -14,6 +14,20 @@ from utils.config import (
     get_server_setting
 )
 
+# Visual for each die face, indexed by value (index 0 unused)
+_DICE_VISUALS = (None, "🔴[1]", "🟠[2]", "🟡[3]", "🟢[4]", "🔵[5]", "🟣[6]")
+
+# Outcomes that decide a payout come from the OS CSPRNG; the decorative animation frames
+# keep using the fast module-level Mersenne Twister
+_OUTCOME_RNG = random.SystemRandom()
+
+# Rolling animation length; each frame costs a REST edit, so fewer, longer frames
+_ROLL_FRAMES = 3
+_ROLL_FRAME_DELAY = 1.2
+
+# Label shown for each choice
+_CHOICE_DISPLAY = {"high": "📈 높음 (8-12)", "low": "📉 낮음 (2-6)"}
+
 
 class HiLowCog(commands.Cog):
     """Hi-Low dice game - Multi-server aware"""
@@ -26,15 +40,7 @@ class HiLowCog(commands.Cog):
 
     def get_dice_visual(self, value):
         """Get visual representation of dice value"""
-        dice_visuals = {
-            1: "🔴[1]",
-            2: "🟠[2]",
-            3: "🟡[3]",
-            4: "🟢[4]",
-            5: "🔵[5]",
-            6: "🟣[6]"
-        }
-        return dice_visuals.get(value, f"🎲[{value}]")
+        return _DICE_VISUALS[value] if 1 <= value <= 6 else f"🎲[{value}]"
 
     def create_dice_display(self, die1, die2, total, rolling=False):
         """Create visual dice display with total analysis"""
@@ -67,7 +73,7 @@ class HiLowCog(commands.Cog):
         max_bet = get_server_setting(interaction.guild.id, 'hilow_max_bet', 200)
 
         return await casino_base.validate_game_start(
-            interaction, "hilow", bet, min_bet, max_bet
+            interaction, "hilow", bet, min_bet, max_bet, check_balance=False
         )
 
     @app_commands.command(name="하이로우", description="7을 기준으로 높음/낮음 맞히기")
@@ -85,46 +91,59 @@ class HiLowCog(commands.Cog):
             await interaction.response.send_message("❌ 이 서버에서는 카지노 게임이 비활성화되어 있습니다!", ephemeral=True)
             return
 
+        # Post-defer errors go through CasinoBaseCog; bail out while a plain response is still possible
+        casino_base = self.bot.get_cog('CasinoBaseCog')
+        if not casino_base:
+            await interaction.response.send_message("카지노 시스템을 찾을 수 없습니다!", ephemeral=True)
+            return
+
+        # Acknowledge before any database work so a slow validate/charge cannot expire the interaction
+        await interaction.response.defer()
+
         can_start, error_msg = await self.validate_game(interaction, bet)
         if not can_start:
-            await interaction.response.send_message(error_msg, ephemeral=True)
+            await casino_base.send_deferred_error(interaction, error_msg)
             return
 
         coins_cog = self.bot.get_cog('CoinsCog')
-        if not await coins_cog.remove_coins(interaction.user.id, interaction.guild.id, bet, "hilow_bet", "Hi-Low bet"):
-            await interaction.response.send_message("베팅 처리 실패!", ephemeral=True)
+        balance = await coins_cog.debit_coins(interaction.user.id, interaction.guild.id, bet, "hilow_bet", "Hi-Low bet")
+        if balance is None:
+            await casino_base.send_deferred_error(
+                interaction, await casino_base.debit_failed_message(interaction.user.id, interaction.guild.id, bet)
+            )
             return
 
-        await interaction.response.defer()
-
-        choice_display = {"high": "📈 높음 (8-12)", "low": "📉 낮음 (2-6)"}
+        choice_label = _CHOICE_DISPLAY[choice]
 
         # Show bet information
         embed = discord.Embed(
             title="🎲 하이로우 게임",
-            description=f"예상: **{choice_display[choice]}**\n베팅: **{bet:,}** 코인\n\n기준점: **7** ⚡",
+            description=f"예상: **{choice_label}**\n베팅: **{bet:,}** 코인\n\n기준점: **7** ⚡",
             color=discord.Color.blue()
         )
         embed.set_footer(text=f"Server: {interaction.guild.name}")
         await interaction.edit_original_response(embed=embed)
         await asyncio.sleep(1.5)
 
-        # Rolling animation
-        for i in range(5):
-            temp_die1 = random.randint(1, 6)
-            temp_die2 = random.randint(1, 6)
-            embed = discord.Embed(
-                title="🎲 하이로우 - 굴리는 중...",
-                description=f"🌀 굴리는 중... {i + 1}/5\n\n{self.create_dice_display(temp_die1, temp_die2, 0, rolling=True)}",
-                color=discord.Color.blue()
-            )
-            embed.set_footer(text=f"Server: {interaction.guild.name}")
-            await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.7)
+        # Rolling animation - draw the faces for every frame in one call
+        frame_faces = random.choices(range(1, 7), k=_ROLL_FRAMES * 2)
+
+        def roll_frames():
+            for i in range(_ROLL_FRAMES):
+                temp_die1, temp_die2 = frame_faces[2 * i], frame_faces[2 * i + 1]
+                embed = discord.Embed(
+                    title="🎲 하이로우 - 굴리는 중...",
+                    description=f"🌀 굴리는 중... {i + 1}/{_ROLL_FRAMES}\n\n{self.create_dice_display(temp_die1, temp_die2, 0, rolling=True)}",
+                    color=discord.Color.blue()
+                )
+                embed.set_footer(text=f"Server: {interaction.guild.name}")
+                yield embed
+
+        message_lost = await casino_base.play_frames(interaction, roll_frames(), _ROLL_FRAME_DELAY)
 
         # Final result
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
+        die1 = _OUTCOME_RNG.randint(1, 6)
+        die2 = _OUTCOME_RNG.randint(1, 6)
         total = die1 + die2
 
         won = False
@@ -138,7 +157,7 @@ class HiLowCog(commands.Cog):
         elif total == 7:
             result_type = "push"
             # Push - return bet
-            await coins_cog.add_coins(interaction.user.id, interaction.guild.id, bet, "hilow_push", "Hi-Low push (7)")
+            balance = await coins_cog.credit_and_get_balance(interaction.user.id, interaction.guild.id, bet, "hilow_push", "Hi-Low push (7)")
         else:
             result_type = "loss"
 
@@ -146,7 +165,7 @@ class HiLowCog(commands.Cog):
             # Get server-specific payout multiplier
             payout_multiplier = get_server_setting(interaction.guild.id, 'hilow_payout', 2.0)
             payout = int(bet * payout_multiplier)
-            await coins_cog.add_coins(interaction.user.id, interaction.guild.id, payout, "hilow_win", f"Hi-Low win: {total}")
+            balance = await coins_cog.credit_and_get_balance(interaction.user.id, interaction.guild.id, payout, "hilow_win", f"Hi-Low win: {total}")
 
         # Create result embed
         if total == 7:
@@ -155,7 +174,7 @@ class HiLowCog(commands.Cog):
                 color=discord.Color.blue()
             )
             result_desc = f"{self.create_dice_display(die1, die2, total)}\n\n"
-            result_desc += f"🎯 예상: **{choice_display[choice]}**\n"
+            result_desc += f"🎯 예상: **{choice_label}**\n"
             result_desc += f"⚡ 정확히 **7**이 나왔습니다!\n"
             result_desc += f"💰 베팅 금액 **{bet:,} 코인** 반환"
 
@@ -166,7 +185,7 @@ class HiLowCog(commands.Cog):
             )
             payout_multiplier = get_server_setting(interaction.guild.id, 'hilow_payout', 2.0)
             result_desc = f"{self.create_dice_display(die1, die2, total)}\n\n"
-            result_desc += f"🎯 예상: **{choice_display[choice]}** ✅\n"
+            result_desc += f"🎯 예상: **{choice_label}** ✅\n"
             result_desc += f"💎 {payout_multiplier}배 배당!\n"
             result_desc += f"💰 획득: **{payout:,}** 코인"
 
@@ -176,13 +195,13 @@ class HiLowCog(commands.Cog):
                 color=discord.Color.red()
             )
             result_desc = f"{self.create_dice_display(die1, die2, total)}\n\n"
-            result_desc += f"🎯 예상: **{choice_display[choice]}** ❌\n"
+            result_desc += f"🎯 예상: **{choice_label}** ❌\n"
             result_desc += f"💸 손실: **{bet:,}** 코인"
 
         embed.description = result_desc
 
-        new_balance = await coins_cog.get_user_coins(interaction.user.id, interaction.guild.id)
-        embed.add_field(name="💳 현재 잔액", value=f"{new_balance:,} 코인", inline=False)
+        # balance is the value returned by the last debit/credit, no extra query needed
+        embed.add_field(name="💳 현재 잔액", value=f"{balance:,} 코인", inline=False)
 
         # Add game rules
         payout_multiplier = get_server_setting(interaction.guild.id, 'hilow_payout', 2.0)
@@ -194,7 +213,7 @@ class HiLowCog(commands.Cog):
         embed.add_field(name="ℹ️ 참고", value=rules_text, inline=False)
         embed.set_footer(text=f"Server: {interaction.guild.name}")
 
-        await interaction.edit_original_response(embed=embed)
+        await casino_base.show_result(interaction, embed, message_lost)
         # FIX: Add extra={'guild_id': ...} for multi-server logging context
         self.logger.info(
             f"{interaction.user}가 하이로우에서 {bet} 코인 {'승리' if won else '패배' if total != 7 else '무승부'}",
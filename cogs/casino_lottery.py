@@ -11,6 +11,19 @@ from utils.config import (
     get_server_setting
 )
 
+# Emoji for each lottery number, indexed by number (index 0 unused)
+_NUMBER_EMOJIS = (None, "1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟")
+
+# Base payout multiplier indexed by how many of the 3 numbers matched
+_BASE_PAYOUTS = (0, 0, 3, 50)
+
+# Draw animation: two frames held longer rather than four quick edits, each revealing one more winning number
+_DRAW_FRAMES = 2
+_DRAW_FRAME_DELAY = 1.6
+
+# Winning numbers are drawn from the OS CSPRNG
+_OUTCOME_RNG = random.SystemRandom()
+
 
 class LotteryCog(commands.Cog):
     """Lottery number matching game - Multi-server aware"""
@@ -23,22 +36,15 @@ class LotteryCog(commands.Cog):
 
     def get_number_emoji(self, number):
         """Convert number to emoji representation"""
-        number_emojis = {
-            1: "1️⃣", 2: "2️⃣", 3: "3️⃣", 4: "4️⃣", 5: "5️⃣",
-            6: "6️⃣", 7: "7️⃣", 8: "8️⃣", 9: "9️⃣", 10: "🔟"
-        }
-        return number_emojis.get(number, str(number))
+        return _NUMBER_EMOJIS[number] if 1 <= number <= 10 else str(number)
 
     def create_lottery_balls_display(self, numbers, highlight=None):
         """Create visual lottery ball display"""
-        ball_display = ""
-        for num in sorted(numbers):
-            emoji = self.get_number_emoji(num)
-            if highlight and num in highlight:
-                ball_display += f"✨{emoji}✨ "
-            else:
-                ball_display += f"{emoji} "
-        return ball_display.strip()
+        highlight = highlight or ()
+        return " ".join(
+            f"✨{self.get_number_emoji(num)}✨" if num in highlight else self.get_number_emoji(num)
+            for num in sorted(numbers)
+        )
 
     async def validate_game(self, interaction: discord.Interaction, bet: int):
         """Validate game using casino base"""
@@ -51,7 +57,7 @@ class LotteryCog(commands.Cog):
         max_bet = get_server_setting(interaction.guild.id, 'lottery_max_bet', 200)
 
         return await casino_base.validate_game_start(
-            interaction, "lottery", bet, min_bet, max_bet
+            interaction, "lottery", bet, min_bet, max_bet, check_balance=False
         )
 
     @app_commands.command(name="복권", description="번호 맞히기 복권")
@@ -65,33 +71,48 @@ class LotteryCog(commands.Cog):
             await interaction.response.send_message("❌ 이 서버에서는 카지노 게임이 비활성화되어 있습니다!", ephemeral=True)
             return
 
-        can_start, error_msg = await self.validate_game(interaction, bet)
-        if not can_start:
-            await interaction.response.send_message(error_msg, ephemeral=True)
-            return
-
+        # Parse the numbers first; it is free, while validate_game hits the database and starts the cooldown
         try:
             chosen_numbers = [int(n.strip()) for n in numbers.split(",")]
             if len(chosen_numbers) != 3:
                 await interaction.response.send_message("정확히 3개의 번호를 선택해주세요!", ephemeral=True)
                 return
-            if not all(1 <= n <= 10 for n in chosen_numbers):
-                await interaction.response.send_message("번호는 1-10 사이만 가능합니다!", ephemeral=True)
-                return
-            if len(set(chosen_numbers)) != 3:
-                await interaction.response.send_message("중복된 번호는 선택할 수 없습니다!", ephemeral=True)
-                return
+            # Range and duplicate checks in one pass, building the chosen numbers' bitmask (bit n set = number n picked)
+            chosen_mask = 0
+            for n in chosen_numbers:
+                if not 1 <= n <= 10:
+                    await interaction.response.send_message("번호는 1-10 사이만 가능합니다!", ephemeral=True)
+                    return
+                if chosen_mask >> n & 1:
+                    await interaction.response.send_message("중복된 번호는 선택할 수 없습니다!", ephemeral=True)
+                    return
+                chosen_mask |= 1 << n
         except ValueError:
             await interaction.response.send_message("올바른 번호 형식이 아닙니다! (예: 1,3,7)", ephemeral=True)
             return
 
-        coins_cog = self.bot.get_cog('CoinsCog')
-        if not await coins_cog.remove_coins(interaction.user.id, interaction.guild.id, bet, "lottery_bet", "Lottery bet"):
-            await interaction.response.send_message("베팅 처리 실패!", ephemeral=True)
+        # CasinoBaseCog reports every error once the interaction is deferred, so it has to be loaded
+        casino_base = self.bot.get_cog('CasinoBaseCog')
+        if not casino_base:
+            await interaction.response.send_message("카지노 시스템을 찾을 수 없습니다!", ephemeral=True)
             return
 
+        # Acknowledge before any database work so a slow validate/charge cannot expire the interaction
         await interaction.response.defer()
 
+        can_start, error_msg = await self.validate_game(interaction, bet)
+        if not can_start:
+            await casino_base.send_deferred_error(interaction, error_msg)
+            return
+
+        coins_cog = self.bot.get_cog('CoinsCog')
+        balance = await coins_cog.debit_coins(interaction.user.id, interaction.guild.id, bet, "lottery_bet", "Lottery bet")
+        if balance is None:
+            await casino_base.send_deferred_error(
+                interaction, await casino_base.debit_failed_message(interaction.user.id, interaction.guild.id, bet)
+            )
+            return
+
         # Show selected numbers
         embed = discord.Embed(
             title="🎫 복권 게임",
@@ -102,32 +123,34 @@ class LotteryCog(commands.Cog):
         await interaction.edit_original_response(embed=embed)
         await asyncio.sleep(1.5)
 
-        # Draw animation with spinning effect
-        for i in range(4):
-            temp_numbers = random.sample(range(1, 11), 3)
-            embed = discord.Embed(
-                title="🎫 복권 추첨 중...",
-                description=f"🎰 번호를 뽑는 중입니다...\n\n{self.create_lottery_balls_display(temp_numbers)}",
-                color=discord.Color.blue()
-            )
-            embed.set_footer(text=f"Server: {interaction.guild.name}")
-            await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.8)
+        # Draw the winning numbers up front; the animation reveals them one at a time
+        winning_numbers = _OUTCOME_RNG.sample(range(1, 11), 3)
+
+        def draw_frames():
+            for i in range(_DRAW_FRAMES):
+                revealed = winning_numbers[:i + 1]
+                hidden = " ❓" * (3 - len(revealed))
+                embed = discord.Embed(
+                    title="🎫 복권 추첨 중...",
+                    description=f"🎰 번호를 뽑는 중입니다...\n\n{self.create_lottery_balls_display(revealed)}{hidden}",
+                    color=discord.Color.blue()
+                )
+                embed.set_footer(text=f"Server: {interaction.guild.name}")
+                yield embed
 
-        # Draw winning numbers
-        winning_numbers = random.sample(range(1, 11), 3)
-        matches = set(chosen_numbers) & set(winning_numbers)
-        match_count = len(matches)
+        message_lost = await casino_base.play_frames(interaction, draw_frames(), _DRAW_FRAME_DELAY)
+
+        # Score the draw
+        match_mask = chosen_mask & sum(1 << n for n in winning_numbers)
+        match_count = match_mask.bit_count()
+        matches = [n for n in winning_numbers if match_mask >> n & 1]
 
         # Payout calculation - server configurable
-        base_payouts = {0: 0, 1: 0, 2: 3, 3: 50}
         multiplier_modifier = get_server_setting(interaction.guild.id, 'lottery_multiplier', 1.0)
-        payouts = {k: int(bet * v * multiplier_modifier) for k, v in base_payouts.items()}
-
-        payout = payouts[match_count]
+        payout = int(bet * _BASE_PAYOUTS[match_count] * multiplier_modifier)
 
         if payout > 0:
-            await coins_cog.add_coins(interaction.user.id, interaction.guild.id, payout, "lottery_win", f"Lottery win: {match_count} matches")
+            balance = await coins_cog.credit_and_get_balance(interaction.user.id, interaction.guild.id, payout, "lottery_win", f"Lottery win: {match_count} matches")
 
         if match_count == 3:
             title = "🎉 대박! 전체 일치!"
@@ -146,7 +169,7 @@ class LotteryCog(commands.Cog):
         result_text += f"**🎯 선택번호:**\n{self.create_lottery_balls_display(chosen_numbers, matches)}\n\n"
 
         if matches:
-            result_text += f"**✨ 일치하는 번호:** {self.create_lottery_balls_display(list(matches))}\n"
+            result_text += f"**✨ 일치하는 번호:** {self.create_lottery_balls_display(matches)}\n"
 
         result_text += f"**📊 일치 개수:** {match_count}개"
 
@@ -161,12 +184,12 @@ class LotteryCog(commands.Cog):
         else:
             embed.add_field(name="💸 손실", value=f"{bet:,} 코인", inline=True)
 
-        new_balance = await coins_cog.get_user_coins(interaction.user.id, interaction.guild.id)
-        embed.add_field(name="💳 현재 잔액", value=f"{new_balance:,} 코인", inline=True)
+        # balance is the value returned by the last debit/credit, no extra query needed
+        embed.add_field(name="💳 현재 잔액", value=f"{balance:,} 코인", inline=True)
 
         # Add payout table with server-specific multipliers
-        payout_3 = int(50 * multiplier_modifier)
-        payout_2 = int(3 * multiplier_modifier)
+        payout_3 = int(_BASE_PAYOUTS[3] * multiplier_modifier)
+        payout_2 = int(_BASE_PAYOUTS[2] * multiplier_modifier)
         embed.add_field(
             name="📋 배당표",
             value=f"3개 일치: {payout_3}배 💎\n2개 일치: {payout_2}배 💚\n1개 이하: 0배 💸",
@@ -174,7 +197,7 @@ class LotteryCog(commands.Cog):
         )
 
         embed.set_footer(text=f"Server: {interaction.guild.name}")
-        await interaction.edit_original_response(embed=embed)
+        await casino_base.show_result(interaction, embed, message_lost)
         # FIX: Add extra={'guild_id': ...} for multi-server logging context
         self.logger.info(
             f"{interaction.user}가 복권에서 {match_count}개 일치 ({bet} 코인)",
@@ -13,6 +13,12 @@ from utils.config import (
     get_server_setting
 )
 
+# Mine placement is the whole outcome of a game; draw it from the OS CSPRNG
+_OUTCOME_RNG = random.SystemRandom()
+
+# Board text with one {} slot per cell, row by row (A1..A5, B1..B5, ...)
+_GRID_TEMPLATE = "```\n    1  2  3  4  5\n" + "\n".join(f"{letter}:" + " {}" * 5 for letter in "ABCDE") + "\n```"
+
 
 class MinesweeperView(discord.ui.View):
     """Interactive Minesweeper game with dropdown selection"""
@@ -48,7 +54,7 @@ class MinesweeperView(discord.ui.View):
         """Generate minefield with specified number of mines"""
         # Create flat list with mines
         cells = [True] * self.mines_count + [False] * (self.total_cells - self.mines_count)
-        random.shuffle(cells)
+        _OUTCOME_RNG.shuffle(cells)
 
         # Convert to 2D grid
         grid = []
@@ -151,24 +157,11 @@ class MinesweeperView(discord.ui.View):
 
     def format_grid(self) -> str:
         """Format the grid for display"""
-        grid_lines = []
-        grid_lines.append("```")
-        grid_lines.append("    1  2  3  4  5")
-
-        for i, letter in enumerate(['A', 'B', 'C', 'D', 'E']):
-            line = f"{letter}:"
-            for j in range(self.grid_size):
-                if self.revealed[i][j]:
-                    if self.grid[i][j]:  # Mine
-                        line += " 💣"
-                    else:  # Gem
-                        line += " 💎"
-                else:  # Hidden
-                    line += " ⬛"
-            grid_lines.append(line)
-
-        grid_lines.append("```")
-        return "\n".join(grid_lines)
+        # Mine 💣, gem 💎, hidden ⬛
+        return _GRID_TEMPLATE.format(*(
+            ("💣" if self.grid[i][j] else "💎") if self.revealed[i][j] else "⬛"
+            for i in range(self.grid_size) for j in range(self.grid_size)
+        ))
 
     async def create_game_embed(self, game_ended: bool = False, won: bool = False) -> discord.Embed:
         """Create the game status embed"""
@@ -2,7 +2,6 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import asyncio
 import random
 
 from utils.logger import get_logger
@@ -11,6 +10,35 @@ from utils.config import (
     get_server_setting
 )
 
+# Colors a player can bet on
+_BET_COLORS = frozenset({"red", "black"})
+
+# Color of every pocket on the wheel, indexed by number (0 is green)
+_RED_NUMBERS = frozenset({1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36})
+_WHEEL_COLORS = tuple(
+    "green" if n == 0 else ("red" if n in _RED_NUMBERS else "black")
+    for n in range(37)
+)
+
+# Winning pockets of each color bet as a bitmask (bit n set = number n wins)
+_COLOR_MASKS = {
+    color: sum(1 << n for n in range(37) if _WHEEL_COLORS[n] == color)
+    for color in _BET_COLORS
+}
+
+# Emoji shown for each pocket color, and (color, emoji) for every pocket indexed by number
+_COLOR_EMOJI = {"red": "🔴", "black": "⚫", "green": "🟢"}
+_WHEEL = tuple((color, _COLOR_EMOJI[color]) for color in _WHEEL_COLORS)
+
+# Spin animation length; every frame is a Discord REST edit against the same rate-limit bucket
+_SPIN_FRAMES = 4
+_SPIN_FRAME_DELAY = 1.0
+# (left, right) progress bars around "스피닝...", cycling every 4 frames
+_BARS = tuple(('⚪' * (n + 1), '⚪' * (3 - n)) for n in range(4))
+
+# RNG for the winning pocket only (spin frames are cosmetic and use `random`)
+_OUTCOME_RNG = random.SystemRandom()
+
 
 class RouletteSimpleCog(commands.Cog):
     """Simple roulette game with single command - Multi-server aware"""
@@ -19,10 +47,6 @@ class RouletteSimpleCog(commands.Cog):
         self.bot = bot
         # FIX: The logger is now a global singleton, so we just get it by name.
         self.logger = get_logger("룰렛")
-
-        # Roulette setup
-        self.red_numbers = {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
-
         self.logger.info("룰렛 게임 시스템이 초기화되었습니다.")
 
     async def validate_game(self, interaction: discord.Interaction, bet: int, min_bet: int, max_bet: int):
@@ -32,7 +56,7 @@ class RouletteSimpleCog(commands.Cog):
             return False, "카지노 시스템을 찾을 수 없습니다!"
 
         return await casino_base.validate_game_start(
-            interaction, "roulette", bet, min_bet, max_bet
+            interaction, "roulette", bet, min_bet, max_bet, check_balance=False
         )
 
     @app_commands.command(name="룰렛", description="룰렛 게임 (색깔 또는 숫자)")
@@ -51,11 +75,13 @@ class RouletteSimpleCog(commands.Cog):
             await interaction.response.send_message("❌ 이 서버에서는 카지노 게임이 비활성화되어 있습니다!", ephemeral=True)
             return
 
-        # Validation based on bet type
+        # Validation based on bet type - the bet is parsed into its win mask here, once
         if bet_type == "color":
-            if value.lower() not in ["red", "black"]:
+            color = value.lower()
+            if color not in _BET_COLORS:
                 await interaction.response.send_message("색깔은 'red' 또는 'black'만 가능합니다!", ephemeral=True)
                 return
+            bet_mask = _COLOR_MASKS[color]
             # Get server-specific limits for color bets
             min_bet = get_server_setting(interaction.guild.id, 'roulette_color_min_bet', 20)
             max_bet = get_server_setting(interaction.guild.id, 'roulette_color_max_bet', 200)
@@ -65,6 +91,7 @@ class RouletteSimpleCog(commands.Cog):
                 if not (0 <= num_value <= 36):
                     await interaction.response.send_message("숫자는 0-36 사이만 가능합니다!", ephemeral=True)
                     return
+                bet_mask = 1 << num_value
             except ValueError:
                 await interaction.response.send_message("유효한 숫자를 입력해주세요!", ephemeral=True)
                 return
@@ -72,54 +99,74 @@ class RouletteSimpleCog(commands.Cog):
             min_bet = get_server_setting(interaction.guild.id, 'roulette_number_min_bet', 10)
             max_bet = get_server_setting(interaction.guild.id, 'roulette_number_max_bet', 500)
 
+        # Errors after the defer are reported through CasinoBaseCog, so make sure it is loaded first
+        casino_base = self.bot.get_cog('CasinoBaseCog')
+        if not casino_base:
+            await interaction.response.send_message("카지노 시스템을 찾을 수 없습니다!", ephemeral=True)
+            return
+
+        # One spin per user at a time; CasinoBaseCog claims the user before the first await so two commands cannot race
+        if not casino_base.start_round(
+            self, interaction.user.id,
+            self.run_round(interaction, casino_base, bet, bet_type, value, bet_mask, min_bet, max_bet)
+        ):
+            await interaction.response.send_message("⏳ 이미 진행 중인 룰렛 게임이 있습니다!", ephemeral=True)
+
+    async def run_round(self, interaction: discord.Interaction, casino_base, bet: int, bet_type: str, value: str,
+                        bet_mask: int, min_bet: int, max_bet: int):
+        """Charge the bet and play it out; runs in the background so the command handler returns right away"""
+        # Acknowledge before any database work so a slow validate/charge cannot expire the interaction
+        await interaction.response.defer()
+
         can_start, error_msg = await self.validate_game(interaction, bet, min_bet, max_bet)
         if not can_start:
-            await interaction.response.send_message(error_msg, ephemeral=True)
+            await casino_base.send_deferred_error(interaction, error_msg)
             return
 
         coins_cog = self.bot.get_cog('CoinsCog')
-        if not await coins_cog.remove_coins(interaction.user.id, interaction.guild.id, bet, "roulette_bet", "Roulette bet"):
-            await interaction.response.send_message("베팅 처리 실패!", ephemeral=True)
+        balance = await coins_cog.debit_coins(interaction.user.id, interaction.guild.id, bet, "roulette_bet", "Roulette bet")
+        if balance is None:
+            await casino_base.send_deferred_error(
+                interaction, await casino_base.debit_failed_message(interaction.user.id, interaction.guild.id, bet)
+            )
             return
 
-        await interaction.response.defer()
+        await self.play_round(interaction, casino_base, coins_cog, bet, bet_type, value, bet_mask, balance)
+
+    async def play_round(self, interaction: discord.Interaction, casino_base, coins_cog, bet: int, bet_type: str,
+                         value: str, bet_mask: int, balance: int):
+        """Spin the wheel with animation, settle the bet and show the result"""
+        # Spinning animation - draw the numbers for every frame in one call (none at all when the bot is lagging)
+        frame_numbers = random.choices(range(37), k=0 if casino_base.should_skip_animation() else _SPIN_FRAMES)
+        # One embed for every frame, only the description changes
+        embed = discord.Embed(title="🎡 룰렛 스핀 중...", color=discord.Color.blue())
+        embed.set_footer(text=f"Server: {interaction.guild.name}")
 
-        # Spinning animation
-        for i in range(8):
-            temp_num = random.randint(0, 36)
-            temp_color = "green" if temp_num == 0 else ("red" if temp_num in self.red_numbers else "black")
-            color_emoji = {"red": "🔴", "black": "⚫", "green": "🟢"}[temp_color]
+        def spin_frames():
+            for i, temp_num in enumerate(frame_numbers):
+                color_emoji = _WHEEL[temp_num][1]
+                left, right = _BARS[i % 4]
+                embed.description = f"{color_emoji} **{temp_num}** 🎡\n\n{left} 스피닝... {right}"
+                yield embed
 
-            embed = discord.Embed(
-                title="🎡 룰렛 스핀 중...",
-                description=f"{color_emoji} **{temp_num}** 🎡\n\n{'⚪' * (i % 4 + 1)} 스피닝... {'⚪' * (3 - i % 4)}",
-                color=discord.Color.blue()
-            )
-            embed.set_footer(text=f"Server: {interaction.guild.name}")
-            await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.5)
+        message_lost = await casino_base.play_frames(interaction, spin_frames(), _SPIN_FRAME_DELAY)
 
         # Final result
-        winning_number = random.randint(0, 36)
-        winning_color = "green" if winning_number == 0 else ("red" if winning_number in self.red_numbers else "black")
-        color_emoji = {"red": "🔴", "black": "⚫", "green": "🟢"}[winning_color]
-
-        won = False
-        payout = 0
+        winning_number = _OUTCOME_RNG.randrange(37)
+        winning_color, color_emoji = _WHEEL[winning_number]
 
         # Get server-specific payout multipliers
-        color_multiplier = get_server_setting(interaction.guild.id, 'roulette_color_multiplier', 2)
-        number_multiplier = get_server_setting(interaction.guild.id, 'roulette_number_multiplier', 36)
+        if bet_type == "color":
+            multiplier = get_server_setting(interaction.guild.id, 'roulette_color_multiplier', 2)
+        else:
+            multiplier = get_server_setting(interaction.guild.id, 'roulette_number_multiplier', 36)
 
-        if bet_type == "color" and value.lower() == winning_color:
-            won = True
-            payout = bet * color_multiplier
-        elif bet_type == "number" and int(value) == winning_number:
-            won = True
-            payout = bet * number_multiplier
+        # A bet wins when the winning number's bit is set in its mask
+        won = bool((bet_mask >> winning_number) & 1)
+        payout = bet * multiplier if won else 0
 
         if won:
-            await coins_cog.add_coins(interaction.user.id, interaction.guild.id, payout, "roulette_win", f"Roulette win: {winning_number}")
+            balance = await coins_cog.credit_and_get_balance(interaction.user.id, interaction.guild.id, payout, "roulette_win", f"Roulette win: {winning_number}")
 
         if won:
             embed = discord.Embed(
@@ -134,11 +181,11 @@ class RouletteSimpleCog(commands.Cog):
                 color=discord.Color.red()
             )
 
-        new_balance = await coins_cog.get_user_coins(interaction.user.id, interaction.guild.id)
-        embed.add_field(name="현재 잔액", value=f"{new_balance:,} 코인", inline=False)
+        # balance is the value returned by the last debit/credit, no extra query needed
+        embed.add_field(name="현재 잔액", value=f"{balance:,} 코인", inline=False)
         embed.set_footer(text=f"Server: {interaction.guild.name}")
 
-        await interaction.edit_original_response(embed=embed)
+        await casino_base.show_result(interaction, embed, message_lost)
         # FIX: Add extra={'guild_id': ...} for multi-server logging context
         self.logger.info(
             f"{interaction.user}가 룰렛에서 {bet} 코인 {'승리' if won else '패배'}",
@@ -4,6 +4,8 @@ from discord.ext import commands
 from discord import app_commands
 import asyncio
 import random
+from itertools import accumulate
+from types import MappingProxyType
 
 from utils.logger import get_logger
 from utils.config import (
@@ -11,31 +13,63 @@ from utils.config import (
     get_server_setting
 )
 
+# Slot symbols with different rarities and payouts (read-only, shared by every game)
+_SYMBOLS = MappingProxyType({
+    '🍒': {'weight': 25, 'payout': 2, 'name': '체리'},
+    '🍋': {'weight': 20, 'payout': 3, 'name': '레몬'},
+    '🍊': {'weight': 20, 'payout': 3, 'name': '오렌지'},
+    '🍇': {'weight': 15, 'payout': 5, 'name': '포도'},
+    '🔔': {'weight': 10, 'payout': 8, 'name': '벨'},
+    '⭐': {'weight': 7, 'payout': 15, 'name': '스타'},
+    '💎': {'weight': 2, 'payout': 50, 'name': '다이아몬드'},
+    '7️⃣': {'weight': 1, 'payout': 100, 'name': '럭키 7'},
+})
+
+# Pair rules for the premium symbols: (base multiplier, minimum multiplier, icon).
+# Every other symbol pays a flat 1.5x on a pair.
+_PAIR_RULES = MappingProxyType({
+    **{symbol: (_SYMBOLS[symbol]['payout'] // 3, 5, "✨") for symbol in ('7️⃣', '💎')},
+    **{symbol: (_SYMBOLS[symbol]['payout'] // 4, 2, "🎯") for symbol in ('⭐', '🔔')},
+})
+
+# Reel animation length; each frame costs a Discord REST edit
+_SPIN_FRAMES = 2
+_SPIN_FRAME_DELAY = 1.4
+_SPINNING_SYMBOLS = ('⚡', '🌟', '💫', '✨')
+
+# Result title and color by payout, best first: (multiple of the bet, whether exactly that multiple counts, color, title)
+_RESULT_TIERS = (
+    (20, True, discord.Color.gold(), "🎰 슬롯머신 - 🔥 메가 잭팟! 🔥"),
+    (10, True, discord.Color.orange(), "🎰 슬롯머신 - 💎 대박! 💎"),
+    (3, False, discord.Color.green(), "🎰 슬롯머신 - ⭐ 빅윈! ⭐"),
+    (1, False, discord.Color.blue(), "🎰 슬롯머신 - 🎯 승리!"),
+)
+_LOSS_TIER = (discord.Color.red(), "🎰 슬롯머신 - 아쉽네요!")
+_SMALL_WIN_TIER = (discord.Color.purple(), "🎰 슬롯머신 - 👍 소액 당첨")
+
+# The final reels decide the payout, so they come from the OS CSPRNG; spin frames use `random`
+_OUTCOME_RNG = random.SystemRandom()
+
 
 class SlotMachineCog(commands.Cog):
     """Classic slot machine game - Multi-server aware"""
 
+    # Symbol data never changes, so the tables derived from it are built once for the class
+    symbols = _SYMBOLS
+    _pair_rules = _PAIR_RULES
+    # Symbols and their cumulative weights for weighted random selection
+    _symbols_list = tuple(_SYMBOLS)
+    _cum_weights = tuple(accumulate(data['weight'] for data in _SYMBOLS.values()))
+    # Symbols sorted by payout for the payout table
+    _symbols_by_payout = tuple(sorted(_SYMBOLS.items(), key=lambda x: x[1]['payout'], reverse=True))
+
     def __init__(self, bot):
         self.bot = bot
         # FIX: The logger is now a global singleton, so we just get it by name.
         self.logger = get_logger("슬롯머신")
 
-        # Slot symbols with different rarities and payouts
-        self.symbols = {
-            '🍒': {'weight': 25, 'payout': 2, 'name': '체리'},
-            '🍋': {'weight': 20, 'payout': 3, 'name': '레몬'},
-            '🍊': {'weight': 20, 'payout': 3, 'name': '오렌지'},
-            '🍇': {'weight': 15, 'payout': 5, 'name': '포도'},
-            '🔔': {'weight': 10, 'payout': 8, 'name': '벨'},
-            '⭐': {'weight': 7, 'payout': 15, 'name': '스타'},
-            '💎': {'weight': 2, 'payout': 50, 'name': '다이아몬드'},
-            '7️⃣': {'weight': 1, 'payout': 100, 'name': '럭키 7'},
-        }
-
-        # Create weighted symbol list for random selection
-        self.symbol_pool = []
-        for symbol, data in self.symbols.items():
-            self.symbol_pool.extend([symbol] * data['weight'])
+        # Payout table text per (payout_multiplier, pair_multiplier)
+        self._payout_tables = {}
 
         self.logger.info("슬롯머신 게임 시스템이 초기화되었습니다.")
 
@@ -50,16 +84,12 @@ class SlotMachineCog(commands.Cog):
         max_bet = get_server_setting(interaction.guild.id, 'slots_max_bet', 50)
 
         return await casino_base.validate_game_start(
-            interaction, "slot_machine", bet, min_bet, max_bet
+            interaction, "slot_machine", bet, min_bet, max_bet, check_balance=False
         )
 
     def spin_reels(self) -> tuple:
         """Spin the slot machine reels"""
-        return (
-            random.choice(self.symbol_pool),
-            random.choice(self.symbol_pool),
-            random.choice(self.symbol_pool)
-        )
+        return tuple(_OUTCOME_RNG.choices(self._symbols_list, cum_weights=self._cum_weights, k=3))
 
     def calculate_payout(self, reel1: str, reel2: str, reel3: str, bet: int, guild_id: int) -> tuple:
         """Calculate payout based on reel results with server-specific multipliers"""
@@ -75,32 +105,34 @@ class SlotMachineCog(commands.Cog):
             return bet * multiplier, f"🎊 **잭팟! {symbol_name} 트리플!** `×{multiplier}`"
 
         # Two of a kind - partial payout
-        elif reel1 == reel2 or reel2 == reel3 or reel1 == reel3:
-            # Find the matching symbol
-            if reel1 == reel2:
-                symbol = reel1
-            elif reel2 == reel3:
-                symbol = reel2
-            else:
-                symbol = reel1
-
-            symbol_name = self.symbols[symbol]['name']
-
-            # Special case for lucky 7s and diamonds - still good payout for pairs
-            if symbol in ['7️⃣', '💎']:
-                multiplier = max(5, int((self.symbols[symbol]['payout'] // 3) * pair_multiplier))
-                return bet * multiplier, f"✨ **{symbol_name} 페어!** `×{multiplier}`"
-            elif symbol in ['⭐', '🔔']:
-                multiplier = max(2, int((self.symbols[symbol]['payout'] // 4) * pair_multiplier))
-                return bet * multiplier, f"🎯 **{symbol_name} 페어!** `×{multiplier}`"
-            else:
-                multiplier = 1.5 * pair_multiplier
-                return int(bet * multiplier), f"🎲 **{symbol_name} 페어** `×{multiplier}`"
+        symbol = reel1 if reel1 == reel2 or reel1 == reel3 else (reel2 if reel2 == reel3 else None)
 
         # No match - lose bet
-        else:
+        if symbol is None:
             return 0, "💸 **꽝!** 다음 기회에..."
 
+        symbol_name = self.symbols[symbol]['name']
+
+        # Lucky 7s, diamonds, stars and bells still pay well for pairs
+        rule = self._pair_rules.get(symbol)
+        if rule:
+            base, minimum, icon = rule
+            multiplier = max(minimum, int(base * pair_multiplier))
+            return bet * multiplier, f"{icon} **{symbol_name} 페어!** `×{multiplier}`"
+
+        multiplier = 1.5 * pair_multiplier
+        return int(bet * multiplier), f"🎲 **{symbol_name} 페어** `×{multiplier}`"
+
+    def get_result_tier(self, payout: int, bet: int) -> tuple:
+        """Pick the result color and title for a payout"""
+        if payout == 0:
+            return _LOSS_TIER
+        for multiple, inclusive, color, title in _RESULT_TIERS:
+            limit = bet * multiple
+            if payout > limit or (inclusive and payout == limit):
+                return color, title
+        return _SMALL_WIN_TIER
+
     def create_slot_display(self, reel1: str, reel2: str, reel3: str, is_spinning: bool = False) -> str:
         """Create clean slot machine display without ASCII art"""
         if is_spinning:
@@ -110,18 +142,17 @@ class SlotMachineCog(commands.Cog):
 
     def create_payout_table(self, guild_id: int) -> str:
         """Create simple single-column payout table with server-specific multipliers"""
-        lines = []
-        sorted_symbols = sorted(self.symbols.items(), key=lambda x: x[1]['payout'], reverse=True)
-
         # Get server multipliers
         payout_multiplier = get_server_setting(guild_id, 'slots_payout_multiplier', 1.0)
         pair_multiplier = get_server_setting(guild_id, 'slots_pair_multiplier', 1.0)
 
-        for symbol, data in sorted_symbols:
-            adjusted_payout = int(data['payout'] * payout_multiplier)
-            lines.append(f"{symbol} = ×{adjusted_payout}")
-
-        return "\n".join(lines) + f"\n\n💡 **페어는 더 낮은 배당** (×{pair_multiplier:.1f})"
+        key = (payout_multiplier, pair_multiplier)
+        table = self._payout_tables.get(key)
+        if table is None:
+            lines = [f"{symbol} = ×{int(data['payout'] * payout_multiplier)}" for symbol, data in self._symbols_by_payout]
+            table = "\n".join(lines) + f"\n\n💡 **페어는 더 낮은 배당** (×{pair_multiplier:.1f})"
+            self._payout_tables[key] = table
+        return table
 
     @app_commands.command(name="슬롯", description="클래식 슬롯머신 게임")
     @app_commands.describe(bet="베팅 금액")
@@ -137,78 +168,49 @@ class SlotMachineCog(commands.Cog):
             return
 
         coins_cog = self.bot.get_cog('CoinsCog')
-        if not await coins_cog.remove_coins(interaction.user.id, interaction.guild.id, bet, "slot_machine_bet", "Slot machine bet"):
-            await interaction.response.send_message("베팅 처리 실패!", ephemeral=True)
+        balance = await coins_cog.debit_coins(interaction.user.id, interaction.guild.id, bet, "slot_machine_bet", "Slot machine bet")
+        if balance is None:
+            await interaction.response.send_message(
+                await self.bot.get_cog('CasinoBaseCog').debit_failed_message(interaction.user.id, interaction.guild.id, bet), ephemeral=True
+            )
             return
 
         await interaction.response.defer()
 
-        # Spinning animation with different frames
-        spinning_symbols = ['⚡', '🌟', '💫', '✨']
-
-        for i in range(4):
-            spin_frame = [random.choice(spinning_symbols) for _ in range(3)]
-
-            embed = discord.Embed(
-                title="🎰 슬롯머신",
-                description=self.create_slot_display(spin_frame[0], spin_frame[1], spin_frame[2], True),
-                color=discord.Color.blue()
-            )
-
-            embed.add_field(
-                name="💰 베팅",
-                value=f"`{bet:,}` 코인",
-                inline=True
-            )
+        # Spinning animation with different frames - all reel symbols for every frame in one call
+        spin_symbols = random.choices(_SPINNING_SYMBOLS, k=3 * _SPIN_FRAMES)
 
-            embed.add_field(
-                name="🎲 상태",
-                value=f"릴 스피닝 중... `{i + 1}/4`",
-                inline=True
-            )
+        # One embed reused for every frame; only the reels and the status field change
+        embed = discord.Embed(title="🎰 슬롯머신", color=discord.Color.blue())
+        embed.add_field(
+            name="💰 베팅",
+            value=f"`{bet:,}` 코인",
+            inline=True
+        )
+        embed.add_field(name="🎲 상태", value="", inline=True)
+        embed.set_footer(text=f"Server: {interaction.guild.name}")
 
-            embed.set_footer(text=f"Server: {interaction.guild.name}")
+        # Go straight to the result while the bot is lagging; each frame is another REST edit
+        casino_base = self.bot.get_cog('CasinoBaseCog')
+        skip_animation = casino_base is not None and casino_base.should_skip_animation()
+        for i in range(0 if skip_animation else _SPIN_FRAMES):
+            embed.description = self.create_slot_display(*spin_symbols[3 * i:3 * i + 3], True)
+            embed.set_field_at(1, name="🎲 상태", value=f"릴 스피닝 중... `{i + 1}/{_SPIN_FRAMES}`", inline=True)
             await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.7)
+            await asyncio.sleep(_SPIN_FRAME_DELAY)
 
         # Final spin result
         reel1, reel2, reel3 = self.spin_reels()
         payout, result_text = self.calculate_payout(reel1, reel2, reel3, bet, interaction.guild.id)
 
         # Determine result color and title
-        if payout == 0:
-            color = discord.Color.red()
-            title = "🎰 슬롯머신 - 아쉽네요!"
-        elif payout >= bet * 20:
-            color = discord.Color.gold()
-            title = "🎰 슬롯머신 - 🔥 메가 잭팟! 🔥"
-        elif payout >= bet * 10:
-            color = discord.Color.orange()
-            title = "🎰 슬롯머신 - 💎 대박! 💎"
-        elif payout > bet * 3:
-            color = discord.Color.green()
-            title = "🎰 슬롯머신 - ⭐ 빅윈! ⭐"
-        elif payout > bet:
-            color = discord.Color.blue()
-            title = "🎰 슬롯머신 - 🎯 승리!"
-        else:
-            color = discord.Color.purple()
-            title = "🎰 슬롯머신 - 👍 소액 당첨"
-
-        embed = discord.Embed(title=title, color=color, timestamp=discord.utils.utcnow())
-
-        # Clean slot display - no code blocks
-        embed.add_field(
-            name="🎯 슬롯 결과",
-            value=self.create_slot_display(reel1, reel2, reel3),
-            inline=False
-        )
+        color, title = self.get_result_tier(payout, bet)
 
         # Combine result and financial info
         result_info = f"{result_text}\n\n"
 
         if payout > 0:
-            await coins_cog.add_coins(interaction.user.id, interaction.guild.id, payout, "slot_machine_win", f"Slot machine win: {reel1}{reel2}{reel3}")
+            balance = await coins_cog.credit_and_get_balance(interaction.user.id, interaction.guild.id, payout, "slot_machine_win", f"Slot machine win: {reel1}{reel2}{reel3}")
 
             profit = payout - bet
             result_info += f"💰 **수익:** {payout:,} 코인\n"
@@ -219,22 +221,21 @@ class SlotMachineCog(commands.Cog):
         else:
             result_info += f"💸 **손실:** {bet:,} 코인"
 
-        embed.add_field(
-            name="📊 게임 결과",
-            value=result_info,
-            inline=False
-        )
-
-        # Balance and server-specific payout info
-        new_balance = await coins_cog.get_user_coins(interaction.user.id, interaction.guild.id)
-
-        balance_payout = f"🏦 **잔액:** {new_balance:,} 코인\n\n**배당표 (트리플):**\n{self.create_payout_table(interaction.guild.id)}"
-
-        embed.add_field(
-            name="💳 정보",
-            value=balance_payout,
-            inline=False
-        )
+        # Balance (as returned by the bet/payout write) and server-specific payout info
+        balance_payout = f"🏦 **잔액:** {balance:,} 코인\n\n**배당표 (트리플):**\n{self.create_payout_table(interaction.guild.id)}"
+
+        # The result embed always has the same three fields, so build it from one dict
+        embed = discord.Embed.from_dict({
+            "title": title,
+            "color": color.value,
+            "timestamp": discord.utils.utcnow().isoformat(),
+            "fields": [
+                # Clean slot display - no code blocks
+                {"name": "🎯 슬롯 결과", "value": self.create_slot_display(reel1, reel2, reel3), "inline": False},
+                {"name": "📊 게임 결과", "value": result_info, "inline": False},
+                {"name": "💳 정보", "value": balance_payout, "inline": False},
+            ],
+        })
 
         # Simple footer
         embed.set_footer(text=f"플레이어: {interaction.user.display_name} | Server: {interaction.guild.name}")
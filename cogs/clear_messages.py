@@ -3,6 +3,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import traceback
+from datetime import timedelta
 
 from utils.logger import get_logger
 from utils.config import (
@@ -11,6 +12,10 @@ from utils.config import (
     is_server_configured
 )
 
+# Discord only bulk-deletes messages younger than 14 days; anything older forces one DELETE call per message.
+# A few minutes of slack keeps messages right at the boundary from tipping purge() off the bulk path.
+_BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+
 
 class ClearMessages(commands.Cog):
     def __init__(self, bot):
@@ -52,10 +57,24 @@ class ClearMessages(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            deleted = await interaction.channel.purge(limit=amount + 1)
-            deleted_count = len(deleted) - 1
+            # Skip messages too old for bulk delete so the whole purge stays a single bulk-delete request
+            cutoff = discord.utils.utcnow() - _BULK_DELETE_MAX_AGE
+            skipped_old = 0
+
+            def is_bulk_deletable(message: discord.Message) -> bool:
+                nonlocal skipped_old
+                if message.created_at > cutoff:
+                    return True
+                skipped_old += 1
+                return False
+
+            deleted = await interaction.channel.purge(limit=amount + 1, check=is_bulk_deletable, bulk=True)
+            deleted_count = max(0, len(deleted) - 1)
 
-            await interaction.followup.send(f"🧹 최근 메시지 {deleted_count}개를 삭제했습니다.", ephemeral=True)
+            result_message = f"🧹 최근 메시지 {deleted_count}개를 삭제했습니다."
+            if skipped_old:
+                result_message += f"\n⚠️ 14일이 지난 메시지 {skipped_old}개는 삭제하지 않았습니다."
+            await interaction.followup.send(result_message, ephemeral=True)
 
             # Log to server-specific log channel
             # FIX: Add guild_id to log message
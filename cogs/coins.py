@@ -592,24 +592,26 @@ class CoinsCog(commands.Cog):
             self.logger.error(f"Error getting coins for {user_id} in guild {guild_id}: {e}", extra={'guild_id': guild_id})
             return 0
 
-    async def add_coins(self, user_id: int, guild_id: int, amount: int, transaction_type: str = "earned",
-                        description: str = ""):
-        """Add coins to user account and trigger leaderboard update"""
+    async def credit_coins(self, user_id: int, guild_id: int, amount: int, transaction_type: str = "earned",
+                           description: str = "") -> Optional[int]:
+        """Add coins to user account. Returns the new balance, or None if the update failed"""
         try:
-            # Update user coins
-            await self.bot.pool.execute("""
-                INSERT INTO user_coins (user_id, guild_id, coins, total_earned)
-                VALUES ($1, $2, $3, $3)
-                ON CONFLICT (user_id, guild_id) 
-                DO UPDATE SET 
-                    coins = user_coins.coins + $3,
-                    total_earned = user_coins.total_earned + $3
-            """, user_id, guild_id, amount)
-
-            # Log transaction
-            await self.bot.pool.execute("""
-                INSERT INTO coin_transactions (user_id, guild_id, amount, transaction_type, description)
-                VALUES ($1, $2, $3, $4, $5)
+            # Update user coins, log the transaction and read back the balance in one statement
+            # (a single round-trip and a single commit instead of two)
+            row = await self.bot.pool.fetchrow("""
+                WITH updated AS (
+                    INSERT INTO user_coins (user_id, guild_id, coins, total_earned)
+                    VALUES ($1, $2, $3, $3)
+                    ON CONFLICT (user_id, guild_id) 
+                    DO UPDATE SET 
+                        coins = user_coins.coins + $3,
+                        total_earned = user_coins.total_earned + $3
+                    RETURNING user_id, guild_id, coins
+                ), logged AS (
+                    INSERT INTO coin_transactions (user_id, guild_id, amount, transaction_type, description)
+                    SELECT user_id, guild_id, $3::integer, $4::varchar, $5::text FROM updated
+                )
+                SELECT coins FROM updated
             """, user_id, guild_id, amount, transaction_type, description)
 
             # Trigger real-time leaderboard update
@@ -617,52 +619,60 @@ class CoinsCog(commands.Cog):
 
             # FIX: Add guild_id to log message
             self.logger.info(f"Added {amount} coins to user {user_id} in guild {guild_id}: {description}", extra={'guild_id': guild_id})
-            return True
+            return row['coins']
         except Exception as e:
             # FIX: Add guild_id to log message
             self.logger.error(f"Error adding coins to {user_id} in guild {guild_id}: {e}", extra={'guild_id': guild_id})
-            return False
-
-    async def remove_coins(self, user_id: int, guild_id: int, amount: int, transaction_type: str = "spent",
-                           description: str = "") -> bool:
-        """Remove coins from user account and trigger leaderboard update"""
-        try:
-            current_coins_str = await self.get_user_coins(user_id, guild_id)
+            return None
 
-            # Solution: Convert the string value to an integer
-            try:
-                current_coins = int(current_coins_str)
-            except (ValueError, TypeError):
-                # FIX: Add guild_id to log message
-                self.logger.error(f"❌ '{user_id}'의 잔액이 유효한 숫자가 아닙니다: {current_coins_str}", extra={'guild_id': guild_id})
-                return False
+    async def credit_and_get_balance(self, user_id: int, guild_id: int, amount: int, transaction_type: str = "earned",
+                                     description: str = "") -> int:
+        """Add coins and return the balance to display; falls back to reading it if the credit failed"""
+        balance = await self.credit_coins(user_id, guild_id, amount, transaction_type, description)
+        if balance is None:
+            balance = await self.get_user_coins(user_id, guild_id)
+        return balance
 
-            if current_coins < amount:
-                return False
+    async def add_coins(self, user_id: int, guild_id: int, amount: int, transaction_type: str = "earned",
+                        description: str = ""):
+        """Add coins to user account and trigger leaderboard update"""
+        return await self.credit_coins(user_id, guild_id, amount, transaction_type, description) is not None
 
-            # Update user coins
-            await self.bot.pool.execute("""
-                UPDATE user_coins 
-                SET coins = coins - $3, total_spent = total_spent + $3
-                WHERE user_id = $1 AND guild_id = $2
-            """, user_id, guild_id, amount)
+    async def debit_coins(self, user_id: int, guild_id: int, amount: int, transaction_type: str = "spent",
+                          description: str = "") -> Optional[int]:
+        """Atomically remove coins if the user can afford it. Returns the new balance, or None if not debited"""
+        try:
+            # Balance check, deduction and transaction log in one statement, so there is no
+            # read-then-write race and the ledger row only exists if the debit happened
+            row = await self.bot.pool.fetchrow("""
+                WITH updated AS (
+                    UPDATE user_coins 
+                    SET coins = coins - $3, total_spent = total_spent + $3
+                    WHERE user_id = $1 AND guild_id = $2 AND coins >= $3
+                    RETURNING user_id, guild_id, coins
+                ), logged AS (
+                    INSERT INTO coin_transactions (user_id, guild_id, amount, transaction_type, description)
+                    SELECT user_id, guild_id, -$3::integer, $4::varchar, $5::text FROM updated
+                )
+                SELECT coins FROM updated
+            """, user_id, guild_id, amount, transaction_type, description)
 
-            # Log transaction
-            await self.bot.pool.execute("""
-                INSERT INTO coin_transactions (user_id, guild_id, amount, transaction_type, description)
-                VALUES ($1, $2, $3, $4, $5)
-            """, user_id, guild_id, -amount, transaction_type, description)
+            if row is None:
+                return None
 
             # Trigger real-time leaderboard update
             self.bot.loop.create_task(self.schedule_leaderboard_update(guild_id))
 
-            # FIX: Add guild_id to log message
             self.logger.info(f"Removed {amount} coins from user {user_id} in guild {guild_id}: {description}", extra={'guild_id': guild_id})
-            return True
+            return row['coins']
         except Exception as e:
-            # FIX: Add guild_id to log message
             self.logger.error(f"Error removing coins from {user_id} in guild {guild_id}: {e}", extra={'guild_id': guild_id})
-            return False
+            return None
+
+    async def remove_coins(self, user_id: int, guild_id: int, amount: int, transaction_type: str = "spent",
+                           description: str = "") -> bool:
+        """Remove coins from user account and trigger leaderboard update"""
+        return await self.debit_coins(user_id, guild_id, amount, transaction_type, description) is not None
 
     # Keep the original scheduled task as a backup/maintenance function
     @tasks.loop(hours=1)  # Reduced frequency since we have real-time updates